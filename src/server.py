@@ -5,96 +5,233 @@ A FastMCP server that provides weather data and forecasts.
 """
 
 import asyncio
+import copy
+import functools
+import inspect
 import json
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import httpx
+from cachetools import TTLCache
 from fastmcp import FastMCP
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # Create the FastMCP server
 mcp = FastMCP("Weather MCP Server")
 
 # National Weather Service API configuration
 NWS_API_BASE = "https://api.weather.gov"
 
-def get_coordinates(location: str) -> tuple:
-    """Get coordinates for a location using a simple geocoding approach."""
-    # For now, return coordinates for major cities
-    # In a real implementation, you'd use a geocoding service
-    city_coords = {
-        "new york": (40.7128, -74.0060),
-        "nyc": (40.7128, -74.0060),
-        "london": (51.5074, -0.1278),
-        "paris": (48.8566, 2.3522),
-        "tokyo": (35.6762, 139.6503),
-        "los angeles": (34.0522, -118.2437),
-        "chicago": (41.8781, -87.6298),
-        "houston": (29.7604, -95.3698),
-        "phoenix": (33.4484, -112.0740),
-        "philadelphia": (39.9526, -75.1652),
-        "san antonio": (29.4241, -98.4936),
-        "san diego": (32.7157, -117.1611),
-        "dallas": (32.7767, -96.7970),
-        "san jose": (37.3382, -121.8863),
-        "austin": (30.2672, -97.7431),
-        "jacksonville": (30.3322, -81.6557),
-        "fort worth": (32.7555, -97.3308),
-        "columbus": (39.9612, -82.9988),
-        "charlotte": (35.2271, -80.8431),
-        "seattle": (47.6062, -122.3321),
-        "denver": (39.7392, -104.9903),
-        "washington": (38.9072, -77.0369),
-        "boston": (42.3601, -71.0589),
-        "el paso": (31.7619, -106.4850),
-        "nashville": (36.1627, -86.7816),
-        "detroit": (42.3314, -83.0458),
-        "oklahoma city": (35.4676, -97.5164),
-        "portland": (45.5152, -122.6784),
-        "las vegas": (36.1699, -115.1398),
-        "memphis": (35.1495, -90.0490),
-        "louisville": (38.2527, -85.7585),
-        "baltimore": (39.2904, -76.6122),
-        "milwaukee": (43.0389, -87.9065),
-        "albuquerque": (35.0844, -106.6504),
-        "tucson": (32.2226, -110.9747),
-        "fresno": (36.7378, -119.7871),
-        "sacramento": (38.5816, -121.4944),
-        "mesa": (33.4152, -111.8315),
-        "kansas city": (39.0997, -94.5786),
-        "atlanta": (33.7490, -84.3880),
-        "long beach": (33.7701, -118.1937),
-        "colorado springs": (38.8339, -104.8214),
-        "raleigh": (35.7796, -78.6382),
-        "miami": (25.7617, -80.1918),
-        "virginia beach": (36.8529, -75.9780),
-        "omaha": (41.2565, -95.9345),
-        "oakland": (37.8044, -122.2712),
-        "minneapolis": (44.9778, -93.2650),
-        "tulsa": (36.1540, -95.9928),
-        "cleveland": (41.4993, -81.6944),
-        "wichita": (37.6872, -97.3301),
-        "arlington": (32.7357, -97.1081)
+# Shared async client so concurrent tool calls overlap on pooled TCP/TLS connections to NWS
+_CLIENT = httpx.AsyncClient(
+    base_url=NWS_API_BASE,
+    http2=True,
+    timeout=10.0,
+    headers={"User-Agent": "mcp-weather/1.0"},
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+)
+
+# Grid points are effectively static per coordinate; weather results change on
+# NWS's own update cadence, so they are kept for a few minutes.
+_POINTS_CACHE = TTLCache(maxsize=512, ttl=86400)
+_CURRENT_WEATHER_CACHE = TTLCache(maxsize=512, ttl=900)
+_FORECAST_CACHE = TTLCache(maxsize=512, ttl=600)
+_ALERTS_CACHE = TTLCache(maxsize=512, ttl=300)
+
+# Upper bound on get_current_weather_batch so one call can't fan out unboundedly
+_MAX_BATCH_LOCATIONS = 20
+
+# Tool output is compact by default since MCP clients parse it; set MCP_PRETTY=1 to indent
+_PRETTY = os.environ.get("MCP_PRETTY", "").lower() in ("1", "true", "yes")
+
+if orjson is not None:
+    _DUMP_OPTION = orjson.OPT_INDENT_2 if _PRETTY else None
+    _loads = orjson.loads
+
+    def _dump(obj: Any) -> str:
+        """Serialize a tool result to a JSON string."""
+        return orjson.dumps(obj, option=_DUMP_OPTION).decode()
+else:
+    _DUMP_KWARGS = {"indent": 2} if _PRETTY else {"separators": (",", ":")}
+    _loads = json.loads
+
+    def _dump(obj: Any) -> str:
+        """Serialize a tool result to a JSON string."""
+        return json.dumps(obj, ensure_ascii=False, **_DUMP_KWARGS)
+
+def _convert_temperature(temp_f: Optional[float], units: str) -> Tuple[Optional[float], str]:
+    """Convert an NWS Fahrenheit temperature to the requested units."""
+    if units == "metric":
+        temp = round((temp_f - 32) * 5/9, 1) if temp_f is not None else None
+        return temp, "°C"
+    return temp_f, "°F"
+
+def _value(period: Dict[str, Any], key: str) -> Any:
+    """Get the "value" of a nested NWS quantity field, or None if it is absent."""
+    field = period.get(key)
+    return field.get("value") if field else None
+
+def _forecast_period(period: Dict[str, Any], units: str) -> Dict[str, Any]:
+    """Shape a single NWS forecast period into the tool's output format."""
+    get = period.get
+    temp, temp_unit = _convert_temperature(get("temperature"), units)
+    return {
+        "name": get("name", ""),
+        "start_time": get("startTime", ""),
+        "end_time": get("endTime", ""),
+        "temperature": temp,
+        "temperature_unit": temp_unit,
+        "conditions": get("shortForecast", ""),
+        "detailed_forecast": get("detailedForecast", ""),
+        "wind_speed": get("windSpeed", ""),
+        "wind_direction": get("windDirection", ""),
+        "humidity": _value(period, "relativeHumidity"),
+        "precipitation_chance": _value(period, "probabilityOfPrecipitation")
     }
-    
+
+def _alert_summary(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape the properties of a single NWS alert feature into the tool's output format."""
+    get = properties.get
+    return {
+        "event": get("event", ""),
+        "headline": get("headline", ""),
+        "description": get("description", ""),
+        "instruction": get("instruction", ""),
+        "severity": get("severity", ""),
+        "urgency": get("urgency", ""),
+        "certainty": get("certainty", ""),
+        "area_desc": get("areaDesc", ""),
+        "effective": get("effective", ""),
+        "expires": get("expires", ""),
+        "sender": get("senderName", ""),
+        "sender_short": get("sender", "")
+    }
+
+# Built-in coordinates for major cities; no geocoding service is used
+_CITY_COORDS: Dict[str, Tuple[float, float]] = {
+    "new york": (40.7128, -74.0060),
+    "nyc": (40.7128, -74.0060),
+    "london": (51.5074, -0.1278),
+    "paris": (48.8566, 2.3522),
+    "tokyo": (35.6762, 139.6503),
+    "los angeles": (34.0522, -118.2437),
+    "chicago": (41.8781, -87.6298),
+    "houston": (29.7604, -95.3698),
+    "phoenix": (33.4484, -112.0740),
+    "philadelphia": (39.9526, -75.1652),
+    "san antonio": (29.4241, -98.4936),
+    "san diego": (32.7157, -117.1611),
+    "dallas": (32.7767, -96.7970),
+    "san jose": (37.3382, -121.8863),
+    "austin": (30.2672, -97.7431),
+    "jacksonville": (30.3322, -81.6557),
+    "fort worth": (32.7555, -97.3308),
+    "columbus": (39.9612, -82.9988),
+    "charlotte": (35.2271, -80.8431),
+    "seattle": (47.6062, -122.3321),
+    "denver": (39.7392, -104.9903),
+    "washington": (38.9072, -77.0369),
+    "boston": (42.3601, -71.0589),
+    "el paso": (31.7619, -106.4850),
+    "nashville": (36.1627, -86.7816),
+    "detroit": (42.3314, -83.0458),
+    "oklahoma city": (35.4676, -97.5164),
+    "portland": (45.5152, -122.6784),
+    "las vegas": (36.1699, -115.1398),
+    "memphis": (35.1495, -90.0490),
+    "louisville": (38.2527, -85.7585),
+    "baltimore": (39.2904, -76.6122),
+    "milwaukee": (43.0389, -87.9065),
+    "albuquerque": (35.0844, -106.6504),
+    "tucson": (32.2226, -110.9747),
+    "fresno": (36.7378, -119.7871),
+    "sacramento": (38.5816, -121.4944),
+    "mesa": (33.4152, -111.8315),
+    "kansas city": (39.0997, -94.5786),
+    "atlanta": (33.7490, -84.3880),
+    "long beach": (33.7701, -118.1937),
+    "colorado springs": (38.8339, -104.8214),
+    "raleigh": (35.7796, -78.6382),
+    "miami": (25.7617, -80.1918),
+    "virginia beach": (36.8529, -75.9780),
+    "omaha": (41.2565, -95.9345),
+    "oakland": (37.8044, -122.2712),
+    "minneapolis": (44.9778, -93.2650),
+    "tulsa": (36.1540, -95.9928),
+    "cleveland": (41.4993, -81.6944),
+    "wichita": (37.6872, -97.3301),
+    "arlington": (32.7357, -97.1081)
+}
+
+# Default to New York if location not found
+_DEFAULT_LOCATION = "new york"
+_DEFAULT_COORDS = _CITY_COORDS[_DEFAULT_LOCATION]
+
+def _typo_distance(a: str, b: str) -> int:
+    """Count the insertions, deletions, substitutions and adjacent swaps turning a into b."""
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                cost = min(cost, previous2[j - 2] + 1)
+            current.append(cost)
+        previous2, previous = previous, current
+    return previous[-1]
+
+@functools.lru_cache(maxsize=1024)
+def get_coordinates(location: str) -> Tuple[str, Tuple[float, float]]:
+    """Resolve a location to a known city name and its coordinates."""
     location_lower = location.lower().strip()
-    if location_lower in city_coords:
-        return city_coords[location_lower]
+    coords = _CITY_COORDS.get(location_lower)
+    if coords is not None:
+        return location_lower, coords
+    
+    # Only accept a plain typo: one edit, or two for long names. Looser matching
+    # maps real cities onto different ones (Reno -> Fresno, Burlington -> Arlington).
+    max_edits = 2 if len(location_lower) >= 12 else 1
+    distance, name = min((_typo_distance(location_lower, name), name) for name in _CITY_COORDS)
+    if distance <= max_edits:
+        return name, _CITY_COORDS[name]
     
-    # Default to New York if location not found
-    return (40.7128, -74.0060)
+    return _DEFAULT_LOCATION, _DEFAULT_COORDS
 
-def get_weather_station(lat: float, lon: float) -> str:
+async def _get_json(url: str) -> Any:
+    """GET an NWS resource and parse the raw response bytes."""
+    response = await _CLIENT.get(url)
+    response.raise_for_status()
+    return _loads(response.content)
+
+async def get_grid_point(lat: float, lon: float) -> dict:
+    """Get the NWS grid point metadata for given coordinates, cached per coordinate."""
+    key = (round(lat, 4), round(lon, 4))
+    grid_data = _POINTS_CACHE.get(key)
+    if grid_data is not None:
+        return grid_data
+    
+    grid_data = await _get_json(f"/points/{lat},{lon}")
+    _POINTS_CACHE[key] = grid_data
+    return grid_data
+
+async def get_forecast_url(lat: float, lon: float) -> str:
+    """Get the NWS forecast URL for given coordinates from the cached grid point."""
+    grid_data = await get_grid_point(lat, lon)
+    return grid_data["properties"]["forecast"]
+
+async def get_weather_station(lat: float, lon: float) -> str:
     """Get the nearest weather station for given coordinates."""
     try:
         # Get the grid point for the coordinates
-        response = httpx.get(f"{NWS_API_BASE}/points/{lat},{lon}", timeout=10.0)
-        response.raise_for_status()
-        data = response.json()
+        data = await get_grid_point(lat, lon)
         
         # Get the observation station
-        station_response = httpx.get(data["properties"]["observationStations"], timeout=10.0)
-        station_response.raise_for_status()
-        stations = station_response.json()
+        stations = await _get_json(data["properties"]["observationStations"])
         
         # Return the first (closest) station
         if stations["features"]:
@@ -105,8 +242,109 @@ def get_weather_station(lat: float, lon: float) -> str:
         return None
 
 
+class WeatherDataError(Exception):
+    """Raised when NWS responds successfully but without usable data for a location."""
+
+def _error_message(e: Exception) -> str:
+    """Describe an exception raised while fetching NWS data."""
+    if isinstance(e, WeatherDataError):
+        return str(e)
+    if isinstance(e, httpx.RequestError):
+        return f"Request failed: {str(e)}"
+    return f"Unexpected error: {str(e)}"
+
+def _error_result(e: Exception) -> Dict[str, str]:
+    """Convert an exception raised while fetching NWS data into a tool error result."""
+    return {"error": _error_message(e)}
+
+# Serialized {"error": ...} split around its value, so error paths only encode the message
+_ERROR_PREFIX, _ERROR_SUFFIX = _dump({"error": ""}).split('""')
+
+def _handle_errors(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """Turn exceptions raised by a tool into a JSON error result."""
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            return _ERROR_PREFIX + _dump(_error_message(e)) + _ERROR_SUFFIX
+    return wrapper
+
+def _normalize_location(location: str) -> str:
+    """Normalize a location name so equivalent spellings share cache entries."""
+    return location.strip().casefold()
+
+def _ttl_cached(cache: TTLCache) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Cache a fetch's successful results, keyed on its arguments with the location normalized."""
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            # Normalize before calling fn so a cached result never echoes one caller's spelling
+            if "location" in bound.arguments:
+                bound.arguments["location"] = _normalize_location(bound.arguments["location"])
+            key = tuple(bound.arguments.values())
+            # Hand out copies so a caller mutating its result can't corrupt the cache
+            cached = cache.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            
+            # Exceptions propagate uncached, so only successful results are stored
+            result = await fn(*bound.args, **bound.kwargs)
+            cache[key] = result
+            return copy.deepcopy(result)
+        return wrapper
+    return decorator
+
+@_ttl_cached(_CURRENT_WEATHER_CACHE)
+async def fetch_current_weather(location: str, units: str = "metric") -> Dict[str, Any]:
+    """Fetch current conditions for a location; raises on failure."""
+    # Get coordinates for the location
+    name, (lat, lon) = get_coordinates(location)
+    
+    # Get the current forecast (first period) as a fallback for current conditions
+    forecast_url = await get_forecast_url(lat, lon)
+    forecast_data = await _get_json(forecast_url)
+    
+    if not forecast_data.get("properties", {}).get("periods"):
+        raise WeatherDataError("No forecast data available for this location")
+    
+    # Use the first forecast period as current conditions
+    current_period = forecast_data["properties"]["periods"][0]
+    get = current_period.get
+    
+    # Convert temperature based on units
+    temp, temp_unit = _convert_temperature(get("temperature"), units)
+    
+    return {
+        "location": name.title(),
+        "temperature": temp,
+        "temperature_unit": temp_unit,
+        "conditions": get("shortForecast", "Unknown"),
+        "detailed_forecast": get("detailedForecast", ""),
+        "wind_speed": get("windSpeed", ""),
+        "wind_direction": get("windDirection", ""),
+        "humidity": _value(current_period, "relativeHumidity"),
+        "precipitation_chance": _value(current_period, "probabilityOfPrecipitation"),
+        "start_time": get("startTime", ""),
+        "end_time": get("endTime", ""),
+        "source": "National Weather Service",
+        "note": "Current conditions based on forecast data"
+    }
+
+async def _current_weather_or_error(location: str, units: str) -> Dict[str, Any]:
+    """Fetch current conditions for a location, returning an error result on failure."""
+    try:
+        return await fetch_current_weather(location, units)
+    except Exception as e:
+        return _error_result(e)
+
 @mcp.tool()
-def get_current_weather(location: str, units: str = "metric") -> str:
+@_handle_errors
+async def get_current_weather(location: str, units: str = "metric") -> str:
     """Get current weather for a specific location using National Weather Service data.
     
     Args:
@@ -116,65 +354,80 @@ def get_current_weather(location: str, units: str = "metric") -> str:
     Returns:
         JSON string with current weather data from National Weather Service
     """
-    try:
-        # Get coordinates for the location
-        lat, lon = get_coordinates(location)
-        
-        # Get the grid point for the coordinates
-        response = httpx.get(f"{NWS_API_BASE}/points/{lat},{lon}", timeout=10.0)
-        response.raise_for_status()
-        grid_data = response.json()
-        
-        # Get the current forecast (first period) as a fallback for current conditions
-        forecast_response = httpx.get(grid_data["properties"]["forecast"], timeout=10.0)
-        forecast_response.raise_for_status()
-        forecast_data = forecast_response.json()
-        
-        if not forecast_data.get("properties", {}).get("periods"):
-            return json.dumps({"error": "No forecast data available for this location"}, indent=2)
-        
-        # Use the first forecast period as current conditions
-        current_period = forecast_data["properties"]["periods"][0]
-        
-        # Convert temperature based on units
-        temp_f = current_period.get("temperature")
-        if temp_f is not None:
-            if units == "metric":
-                temp_c = (temp_f - 32) * 5/9
-                temp = round(temp_c, 1)
-                temp_unit = "°C"
-            else:
-                temp = temp_f
-                temp_unit = "°F"
-        else:
-            temp = None
-            temp_unit = "°C" if units == "metric" else "°F"
-        
-        weather_data = {
-            "location": location.title(),
-            "temperature": temp,
-            "temperature_unit": temp_unit,
-            "conditions": current_period.get("shortForecast", "Unknown"),
-            "detailed_forecast": current_period.get("detailedForecast", ""),
-            "wind_speed": current_period.get("windSpeed", ""),
-            "wind_direction": current_period.get("windDirection", ""),
-            "humidity": current_period.get("relativeHumidity", {}).get("value") if current_period.get("relativeHumidity") else None,
-            "precipitation_chance": current_period.get("probabilityOfPrecipitation", {}).get("value") if current_period.get("probabilityOfPrecipitation") else None,
-            "start_time": current_period.get("startTime", ""),
-            "end_time": current_period.get("endTime", ""),
-            "source": "National Weather Service",
-            "note": "Current conditions based on forecast data"
-        }
-        
-        return json.dumps(weather_data, indent=2)
-        
-    except httpx.RequestError as e:
-        return json.dumps({"error": f"Request failed: {str(e)}"}, indent=2)
-    except Exception as e:
-        return json.dumps({"error": f"Unexpected error: {str(e)}"}, indent=2)
+    return _dump(await fetch_current_weather(location, units))
+
+@mcp.tool()
+async def get_current_weather_batch(locations: List[str], units: str = "metric") -> str:
+    """Get current weather for several locations at once using National Weather Service data.
+    
+    Args:
+        locations: City names (e.g., ["New York", "Boston", "Miami"]), at most 20
+        units: Units of measurement: metric or imperial (default: metric)
+    
+    Returns:
+        JSON string with current weather data for each location, in request order
+    """
+    if len(locations) > _MAX_BATCH_LOCATIONS:
+        return _dump({"error": f"Too many locations: at most {_MAX_BATCH_LOCATIONS} per batch"})
+    
+    # Fetch each distinct location once, concurrently; each one fails independently
+    names = [_normalize_location(location) for location in locations]
+    unique_names = list(dict.fromkeys(names))
+    fetched = await asyncio.gather(*(_current_weather_or_error(name, units) for name in unique_names))
+    by_name = dict(zip(unique_names, fetched))
+    results = [by_name[name] for name in names]
+    
+    batch_result = {
+        "results": results,
+        "count": len(results),
+        "source": "National Weather Service"
+    }
+    
+    return _dump(batch_result)
+
+@_ttl_cached(_FORECAST_CACHE)
+async def fetch_forecast(location: str, days: int = 5, units: str = "metric") -> Dict[str, Any]:
+    """Fetch the day/night forecast periods for a location; raises on failure."""
+    # Get coordinates for the location
+    name, (lat, lon) = get_coordinates(location)
+    
+    # Get the forecast
+    forecast_url = await get_forecast_url(lat, lon)
+    forecast_data = await _get_json(forecast_url)
+    
+    periods = forecast_data["properties"]["periods"][:days * 2]  # 2 periods per day (day/night)
+    forecasts = [_forecast_period(period, units) for period in periods]
+    
+    return {
+        "location": name.title(),
+        "forecast": forecasts,
+        "units": units,
+        "source": "National Weather Service",
+        "updated": forecast_data.get("properties", {}).get("updated", "")
+    }
+
+@_ttl_cached(_ALERTS_CACHE)
+async def fetch_weather_alerts(location: str) -> Dict[str, Any]:
+    """Fetch active NWS alerts for a location; raises on failure."""
+    # Get coordinates for the location
+    name, (lat, lon) = get_coordinates(location)
+    
+    # Get alerts for the area using the direct alerts endpoint
+    alerts_data = await _get_json(f"/alerts?point={lat},{lon}")
+    
+    alerts = [_alert_summary(alert.get("properties", {})) for alert in alerts_data.get("features", [])]
+    
+    return {
+        "location": name.title(),
+        "alerts": alerts,
+        "count": len(alerts),
+        "source": "National Weather Service",
+        "updated": alerts_data.get("updated", "")
+    }
 
 @mcp.tool()
-def get_forecast(location: str, days: int = 5, units: str = "metric") -> str:
+@_handle_errors
+async def get_forecast(location: str, days: int = 5, units: str = "metric") -> str:
     """Get weather forecast for a location using National Weather Service data.
     
     Args:
@@ -185,69 +438,12 @@ def get_forecast(location: str, days: int = 5, units: str = "metric") -> str:
     Returns:
         JSON string with detailed forecast data from National Weather Service
     """
-    try:
-        days = min(max(days, 1), 5)  # Clamp between 1 and 5
-        
-        # Get coordinates for the location
-        lat, lon = get_coordinates(location)
-        
-        # Get the grid point for the coordinates
-        response = httpx.get(f"{NWS_API_BASE}/points/{lat},{lon}", timeout=10.0)
-        response.raise_for_status()
-        grid_data = response.json()
-        
-        # Get the forecast
-        forecast_response = httpx.get(grid_data["properties"]["forecast"], timeout=10.0)
-        forecast_response.raise_for_status()
-        forecast_data = forecast_response.json()
-        
-        forecasts = []
-        for period in forecast_data["properties"]["periods"][:days * 2]:  # 2 periods per day (day/night)
-            # Convert temperature based on units
-            temp_f = period.get("temperature")
-            if temp_f is not None:
-                if units == "metric":
-                    temp_c = (temp_f - 32) * 5/9
-                    temp = round(temp_c, 1)
-                    temp_unit = "°C"
-                else:
-                    temp = temp_f
-                    temp_unit = "°F"
-            else:
-                temp = None
-                temp_unit = "°C" if units == "metric" else "°F"
-            
-            forecasts.append({
-                "name": period.get("name", ""),
-                "start_time": period.get("startTime", ""),
-                "end_time": period.get("endTime", ""),
-                "temperature": temp,
-                "temperature_unit": temp_unit,
-                "conditions": period.get("shortForecast", ""),
-                "detailed_forecast": period.get("detailedForecast", ""),
-                "wind_speed": period.get("windSpeed", ""),
-                "wind_direction": period.get("windDirection", ""),
-                "humidity": period.get("relativeHumidity", {}).get("value") if period.get("relativeHumidity") else None,
-                "precipitation_chance": period.get("probabilityOfPrecipitation", {}).get("value") if period.get("probabilityOfPrecipitation") else None
-            })
-        
-        forecast_result = {
-            "location": location.title(),
-            "forecast": forecasts,
-            "units": units,
-            "source": "National Weather Service",
-            "updated": forecast_data.get("properties", {}).get("updated", "")
-        }
-        
-        return json.dumps(forecast_result, indent=2)
-        
-    except httpx.RequestError as e:
-        return json.dumps({"error": f"Request failed: {str(e)}"}, indent=2)
-    except Exception as e:
-        return json.dumps({"error": f"Unexpected error: {str(e)}"}, indent=2)
+    days = min(max(days, 1), 5)  # Clamp between 1 and 5
+    return _dump(await fetch_forecast(location, days, units))
 
 @mcp.tool()
-def get_weather_alerts(location: str) -> str:
+@_handle_errors
+async def get_weather_alerts(location: str) -> str:
     """Get weather alerts for a location using National Weather Service data.
     
     Args:
@@ -256,47 +452,7 @@ def get_weather_alerts(location: str) -> str:
     Returns:
         JSON string with official weather alerts from National Weather Service
     """
-    try:
-        # Get coordinates for the location
-        lat, lon = get_coordinates(location)
-        
-        # Get alerts for the area using the direct alerts endpoint
-        alerts_response = httpx.get(f"{NWS_API_BASE}/alerts?point={lat},{lon}", timeout=10.0)
-        alerts_response.raise_for_status()
-        alerts_data = alerts_response.json()
-        
-        alerts = []
-        for alert in alerts_data.get("features", []):
-            properties = alert.get("properties", {})
-            alerts.append({
-                "event": properties.get("event", ""),
-                "headline": properties.get("headline", ""),
-                "description": properties.get("description", ""),
-                "instruction": properties.get("instruction", ""),
-                "severity": properties.get("severity", ""),
-                "urgency": properties.get("urgency", ""),
-                "certainty": properties.get("certainty", ""),
-                "area_desc": properties.get("areaDesc", ""),
-                "effective": properties.get("effective", ""),
-                "expires": properties.get("expires", ""),
-                "sender": properties.get("senderName", ""),
-                "sender_short": properties.get("sender", "")
-            })
-        
-        alert_result = {
-            "location": location.title(),
-            "alerts": alerts,
-            "count": len(alerts),
-            "source": "National Weather Service",
-            "updated": alerts_data.get("updated", "")
-        }
-        
-        return json.dumps(alert_result, indent=2)
-        
-    except httpx.RequestError as e:
-        return json.dumps({"error": f"Request failed: {str(e)}"}, indent=2)
-    except Exception as e:
-        return json.dumps({"error": f"Unexpected error: {str(e)}"}, indent=2)
+    return _dump(await fetch_weather_alerts(location))
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
@@ -0,0 +1,259 @@
+"""
+Tests for the Weather MCP Server tools, run against a mocked NWS API.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from fastmcp import Client
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import server  # noqa: E402
+
+FORECAST_URL = "https://api.weather.gov/gridpoints/BOX/71,90/forecast"
+
+
+def make_period(number: int) -> dict:
+    """Build an NWS-shaped forecast period."""
+    return {
+        "number": number,
+        "name": f"Period {number}",
+        "startTime": f"2026-10-14T{number:02d}:00:00-04:00",
+        "endTime": f"2026-10-14T{number + 1:02d}:00:00-04:00",
+        "isDaytime": number % 2 == 0,
+        "temperature": 50 + number,
+        "temperatureUnit": "F",
+        "probabilityOfPrecipitation": {"unitCode": "wmoUnit:percent", "value": None},
+        "relativeHumidity": {"unitCode": "wmoUnit:percent", "value": 60},
+        "windSpeed": "10 mph",
+        "windDirection": "NW",
+        "shortForecast": "Sunny",
+        "detailedForecast": "Sunny, with a high near 60."
+    }
+
+
+class FakeNWS:
+    """Serves canned NWS responses and records every request made."""
+
+    def __init__(self):
+        self.requests = []
+        self.periods = [make_period(i) for i in range(14)]
+        self.features = []
+        self.fail = False
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail:
+            raise httpx.ConnectError("connection refused", request=request)
+        path = request.url.path
+        if path.startswith("/points/"):
+            return httpx.Response(200, json={"properties": {"forecast": FORECAST_URL}})
+        if path.endswith("/forecast"):
+            return httpx.Response(200, json={"properties": {"updated": "2026-10-14T06:00:00+00:00", "periods": self.periods}})
+        if path == "/alerts":
+            return httpx.Response(200, json={"updated": "2026-10-14T06:00:00+00:00", "features": self.features})
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def nws(monkeypatch):
+    fake = FakeNWS()
+    client = httpx.AsyncClient(base_url=server.NWS_API_BASE, transport=httpx.MockTransport(fake))
+    monkeypatch.setattr(server, "_CLIENT", client)
+    for cache in (server._POINTS_CACHE, server._CURRENT_WEATHER_CACHE, server._FORECAST_CACHE, server._ALERTS_CACHE):
+        cache.clear()
+    yield fake
+    asyncio.run(client.aclose())
+
+
+def call_tool(name: str, **arguments) -> dict:
+    """Call an MCP tool in-process and decode its JSON text result."""
+    async def run():
+        async with Client(server.mcp) as client:
+            result = await client.call_tool(name, arguments)
+            return json.loads(result.content[0].text)
+    return asyncio.run(run())
+
+
+def test_current_weather_uses_first_period(nws):
+    result = call_tool("get_current_weather", location="Boston")
+
+    assert result["location"] == "Boston"
+    assert result["temperature"] == 10.0
+    assert result["temperature_unit"] == "°C"
+    assert result["conditions"] == "Sunny"
+    assert result["humidity"] == 60
+    assert result["precipitation_chance"] is None
+    assert result["start_time"] == nws.periods[0]["startTime"]
+
+
+def test_current_weather_without_periods_is_an_error(nws):
+    nws.periods = []
+
+    result = call_tool("get_current_weather", location="Boston")
+
+    assert result == {"error": "No forecast data available for this location"}
+
+
+def test_forecast_returns_two_periods_per_day(nws):
+    result = call_tool("get_forecast", location="Boston", days=2, units="imperial")
+
+    assert [period["name"] for period in result["forecast"]] == ["Period 0", "Period 1", "Period 2", "Period 3"]
+    assert result["forecast"][3]["temperature"] == 53
+    assert result["forecast"][3]["temperature_unit"] == "°F"
+    assert result["updated"] == "2026-10-14T06:00:00+00:00"
+
+
+def test_alerts_are_summarized(nws):
+    nws.features = [{"properties": {"event": "Flood Warning", "severity": "Severe", "senderName": "NWS Boston MA"}}]
+
+    result = call_tool("get_weather_alerts", location="Boston")
+
+    assert result["count"] == 1
+    assert result["alerts"][0]["event"] == "Flood Warning"
+    assert result["alerts"][0]["severity"] == "Severe"
+    assert result["alerts"][0]["sender"] == "NWS Boston MA"
+    assert result["alerts"][0]["headline"] == ""
+
+
+def test_no_alerts(nws):
+    result = call_tool("get_weather_alerts", location="Boston")
+
+    assert result == {
+        "location": "Boston",
+        "alerts": [],
+        "count": 0,
+        "source": "National Weather Service",
+        "updated": "2026-10-14T06:00:00+00:00"
+    }
+
+
+def test_repeat_calls_are_served_from_cache(nws):
+    call_tool("get_current_weather", location="Boston")
+    call_tool("get_forecast", location="Boston")
+    call_tool("get_weather_alerts", location="Boston")
+    request_count = len(nws.requests)
+
+    call_tool("get_current_weather", location=" BOSTON ")
+    call_tool("get_forecast", location="boston")
+    call_tool("get_weather_alerts", location="Boston")
+
+    assert len(nws.requests) == request_count
+
+
+def test_cached_result_does_not_echo_first_spelling(nws):
+    call_tool("get_current_weather", location="  new york")
+
+    result = call_tool("get_current_weather", location="NEW YORK")
+
+    assert result["location"] == "New York"
+
+
+def test_mutating_a_result_does_not_corrupt_the_cache(nws):
+    result = asyncio.run(server.fetch_forecast("Boston"))
+    result["location"] = "Mutated"
+    result["forecast"].clear()
+
+    cached = asyncio.run(server.fetch_forecast("Boston"))
+    cached["forecast"][0]["name"] = "Mutated"
+
+    result = asyncio.run(server.fetch_forecast("Boston"))
+    assert result["location"] == "Boston"
+    assert result["forecast"][0]["name"] != "Mutated"
+
+
+def test_forecast_cache_keys_on_clamped_days(nws):
+    call_tool("get_forecast", location="Boston", days=5)
+    call_tool("get_forecast", location="Boston", days=9)
+
+    assert len(server._FORECAST_CACHE) == 1
+
+
+def test_request_failures_are_not_cached(nws):
+    nws.fail = True
+    result = call_tool("get_current_weather", location="Boston")
+    assert result["error"].startswith("Request failed: ")
+
+    nws.fail = False
+    result = call_tool("get_current_weather", location="Boston")
+    assert result["location"] == "Boston"
+
+
+def test_missing_forecast_data_is_not_cached(nws):
+    nws.periods = []
+    call_tool("get_current_weather", location="Boston")
+    assert len(server._CURRENT_WEATHER_CACHE) == 0
+
+    nws.periods = [make_period(0)]
+    result = call_tool("get_current_weather", location="Boston")
+    assert result["temperature"] == 10.0
+
+
+def test_batch_dedupes_and_shares_the_cache(nws):
+    call_tool("get_current_weather", location="Boston")
+    request_count = len(nws.requests)
+
+    result = call_tool("get_current_weather_batch", locations=["Boston", "boston ", "BOSTON"])
+
+    assert len(nws.requests) == request_count
+    assert result["count"] == 3
+    assert [entry["location"] for entry in result["results"]] == ["Boston"] * 3
+
+
+def test_batch_reports_errors_per_location(nws):
+    call_tool("get_current_weather", location="Boston")
+    nws.fail = True
+
+    result = call_tool("get_current_weather_batch", locations=["Boston", "Miami"])
+
+    assert result["results"][0]["location"] == "Boston"
+    assert result["results"][1]["error"].startswith("Request failed: ")
+
+
+def test_batch_rejects_too_many_locations(nws):
+    result = call_tool("get_current_weather_batch", locations=["Boston"] * (server._MAX_BATCH_LOCATIONS + 1))
+
+    assert "error" in result
+    assert nws.requests == []
+
+
+def test_exact_city_lookup():
+    assert server.get_coordinates("  Seattle ") == ("seattle", (47.6062, -122.3321))
+
+
+def test_misspelled_city_matches_nearest_name():
+    assert server.get_coordinates("Seatle") == server.get_coordinates("seattle")
+    assert server.get_coordinates("new yrok") == server.get_coordinates("new york")
+
+
+def test_result_is_labelled_with_the_matched_city(nws):
+    result = call_tool("get_current_weather", location="Seatle")
+
+    assert result["location"] == "Seattle"
+
+
+def test_unknown_city_falls_back_to_default():
+    assert server.get_coordinates("Springfield") == (server._DEFAULT_LOCATION, server._DEFAULT_COORDS)
+
+
+@pytest.mark.parametrize("location", ["Orlando", "Reno", "Burlington"])
+def test_real_city_is_not_matched_to_a_different_one(location):
+    assert server.get_coordinates(location) == (server._DEFAULT_LOCATION, server._DEFAULT_COORDS)
+
+
+@pytest.mark.parametrize("message", ["Request failed: boom", 'quote " and backslash \\', "newline\nand °"])
+def test_error_envelope_matches_dump(message):
+    assert server._ERROR_PREFIX + server._dump(message) + server._ERROR_SUFFIX == server._dump({"error": message})
+
+
+def test_tool_errors_use_the_envelope(nws):
+    nws.fail = True
+
+    result = call_tool("get_forecast", location="Boston")
+
+    assert result == {"error": "Request failed: connection refused"}